@@ -20,11 +20,297 @@
 # *********************************************************************
 # Import Section                                                      *
 # *********************************************************************
+from __future__ import annotations
+
 import tkinter as tk
 from tkinter import filedialog, messagebox
-from reportlab.pdfgen import canvas
-from PIL import Image, ImageOps
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from io import BytesIO
+from typing import TYPE_CHECKING
+import itertools
+import math
 import os
+import stat
+import struct
+import sys
+
+# Pillow and ReportLab are imported on first use to keep startup fast
+if TYPE_CHECKING:
+    from PIL import Image
+
+# *********************************************************************
+# Pillow Settings                                                     *
+# *********************************************************************
+def _import_pil():
+    """Import Pillow on first use (per process) and apply decoder settings."""
+
+    from PIL import Image, ImageFile, ImageOps
+
+    # Decode what is readable from a damaged file instead of aborting the batch
+    ImageFile.LOAD_TRUNCATED_IMAGES = True
+
+    # Larger encoder buffer so optimized/progressive JPEG saves stay in memory
+    ImageFile.MAXBLOCK = 2 ** 22
+
+    return Image, ImageOps
+
+# *********************************************************************
+# Page Layout Settings                                                *
+# *********************************************************************
+PORTRAIT_SIZE = (612, 792)   # Letter portrait
+LANDSCAPE_SIZE = (792, 612)  # Letter landscape
+PAGE_MARGIN = 36             # 0.5 inch
+RENDER_DPI = 150             # Pixel density images are pre-scaled to
+JPEG_QUALITY = 80            # Default quality when an image must be re-encoded
+JPEG_QUALITY_MIN = 10        # Lowest quality offered in the UI
+JPEG_QUALITY_MAX = 95        # Highest quality offered in the UI
+EXIF_ORIENTATION = 0x0112    # EXIF tag holding camera rotation
+PAGE_CACHE_SIZE = 64         # Prepared page images kept between conversions
+
+# File types accepted for conversion (matches the file dialog filter)
+SUPPORTED_EXTENSIONS = {".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff"}
+
+# *********************************************************************
+# Startup Probe                                                       *
+# *********************************************************************
+def _pillow_simd_hint() -> str | None:
+    """Suggest pillow-simd on Linux CPUs with SSE4.1 when stock Pillow is installed."""
+
+    if not sys.platform.startswith("linux"):
+        return None
+
+    from importlib import metadata
+    try:
+        metadata.version("Pillow-SIMD")
+        return None  # already installed
+    except metadata.PackageNotFoundError:
+        pass
+
+    try:
+        with open("/proc/cpuinfo") as f:
+            cpuinfo = f.read()
+    except OSError:
+        return None
+
+    if "sse4_1" not in cpuinfo:
+        return None
+    return "Ready. Tip: 'pip install pillow-simd' speeds up image processing."
+
+# *********************************************************************
+# Image Preparation Helpers                                           *
+# ---------------------------------------------------------------------
+#   Module-level so they can be pickled and run in worker processes.  *
+# *********************************************************************
+def _page_layout(width: int, height: int) -> tuple[int, int, float, float, float, float]:
+    """Return (page_w, page_h, x, y, new_w, new_h) for an image of the given size."""
+
+    # Auto page orientation based on image shape
+    page_w, page_h = PORTRAIT_SIZE if height >= width else LANDSCAPE_SIZE
+
+    # Margins & available area
+    available_w = page_w - 2 * PAGE_MARGIN
+    available_h = page_h - 2 * PAGE_MARGIN
+
+    # Scale to fit while preserving aspect ratio
+    scale = min(available_w / width, available_h / height)
+    new_w = width * scale
+    new_h = height * scale
+
+    # Center on page
+    x = (page_w - new_w) / 2
+    y = (page_h - new_h) / 2
+
+    return page_w, page_h, x, y, new_w, new_h
+
+
+def _scale_hint(width: int, height: int) -> tuple[int, int]:
+    """Return the page size in pixels at RENDER_DPI for an image of the given shape."""
+
+    page_w, page_h = PORTRAIT_SIZE if height >= width else LANDSCAPE_SIZE
+    return math.ceil(page_w * RENDER_DPI / 72), math.ceil(page_h * RENDER_DPI / 72)
+
+
+def _exif_orientation(app1: bytes) -> int | None:
+    """Return the Orientation value from an APP1 payload, or None if it is not EXIF."""
+
+    if not app1.startswith(b"Exif\x00\x00"):
+        return None
+
+    # TIFF header: byte order, magic, offset of IFD0
+    tiff = app1[6:]
+    if len(tiff) < 8 or tiff[:2] not in (b"II", b"MM"):
+        return None
+    endian = "<" if tiff[:2] == b"II" else ">"
+    (ifd0,) = struct.unpack(endian + "I", tiff[4:8])
+    if ifd0 + 2 > len(tiff):
+        return None
+
+    # Walk IFD0 entries (12 bytes each) looking for the Orientation tag
+    (count,) = struct.unpack(endian + "H", tiff[ifd0:ifd0 + 2])
+    for n in range(count):
+        entry = ifd0 + 2 + 12 * n
+        if entry + 12 > len(tiff):
+            break
+        (tag,) = struct.unpack(endian + "H", tiff[entry:entry + 2])
+        if tag == EXIF_ORIENTATION:
+            (value,) = struct.unpack(endian + "H", tiff[entry + 8:entry + 10])
+            return value
+
+    return 1
+
+
+def _fast_jpeg_metadata(image_path: str) -> tuple[int, int, int] | None:
+    """Read (width, height, orientation) from JPEG headers without decoding pixels.
+
+    Returns None unless the file is a baseline or progressive RGB/grayscale
+    JPEG that ReportLab can embed verbatim.
+    """
+
+    orientation = 1
+    with open(image_path, "rb") as f:
+        if f.read(2) != b"\xff\xd8":  # SOI
+            return None
+
+        while True:
+            marker = f.read(2)
+            if len(marker) < 2 or marker[0] != 0xFF:
+                return None
+            code = marker[1]
+
+            # Fill bytes and standalone markers carry no length field
+            if code == 0xFF:
+                f.seek(-1, os.SEEK_CUR)
+                continue
+            if code == 0x01 or 0xD0 <= code <= 0xD7:
+                continue
+
+            header = f.read(2)
+            if len(header) < 2:
+                return None
+            (length,) = struct.unpack(">H", header)
+            if length < 2:
+                return None
+
+            # SOF0/SOF1/SOF2: precision, height, width, component count
+            if code in (0xC0, 0xC1, 0xC2):
+                frame = f.read(6)
+                if len(frame) < 6:
+                    return None
+                _, height, width, components = struct.unpack(">BHHB", frame)
+                if not width or not height or components not in (1, 3):
+                    return None
+                return width, height, orientation
+
+            # Lossless/arithmetic frames, scan data or EOI before a frame header
+            if 0xC3 <= code <= 0xCF and code not in (0xC4, 0xC8, 0xCC) or code in (0xD9, 0xDA):
+                return None
+
+            # APP1 may hold EXIF (or XMP, which is skipped)
+            if code == 0xE1:
+                found = _exif_orientation(f.read(length - 2))
+                if found is not None:
+                    orientation = found
+            else:
+                f.seek(length - 2, os.SEEK_CUR)
+
+
+def _flatten_on_white(img: Image.Image) -> Image.Image:
+    """Composite an RGBA or LA image onto an opaque white background and return it as RGB."""
+
+    Image, _ = _import_pil()
+
+    # Pasting through the alpha channel blends onto the white background in C,
+    # with the same result as alpha_composite + convert("RGB"). The background
+    # only needs the colour channels (RGB, or L for grayscale + alpha), so no
+    # 4-channel buffer is ever allocated.
+    base_mode = "L" if img.mode == "LA" else "RGB"
+    out = Image.new(base_mode, img.size, 255)
+    out.paste(img, mask=img.getchannel("A"))
+    return out.convert("RGB") if base_mode == "L" else out
+
+
+def _is_portrait(image_path: str) -> bool:
+    """Cheaply tell whether an image will get a portrait page, without decoding pixels."""
+
+    meta = _fast_jpeg_metadata(image_path)
+    if meta is not None:
+        width, height, orientation = meta
+    else:
+        # Image.open only parses the header; pixels load lazily
+        Image, _ = _import_pil()
+        with Image.open(image_path) as img:
+            width, height = img.size
+            orientation = img.getexif().get(EXIF_ORIENTATION, 1)
+
+    # EXIF orientations 5-8 rotate by 90 degrees and swap the sides
+    if orientation in (5, 6, 7, 8):
+        width, height = height, width
+    return height >= width
+
+
+def _prepare_image(image_path: str, quality: int) -> tuple[bytes, int, int]:
+    """Decode, normalize and pre-scale one image.
+
+    Returns (jpeg_bytes, width, height), where width/height are the full-size,
+    EXIF-rotated dimensions used for page layout.
+    """
+
+    Image, ImageOps = _import_pil()
+
+    # Open image safely
+    with Image.open(image_path) as img:
+        # Full-size, upright dimensions from the header (before draft() shrinks
+        # them), so layout matches _is_portrait; orientations 5-8 swap the sides
+        width, height = img.size
+        if img.getexif().get(EXIF_ORIENTATION, 1) in (5, 6, 7, 8):
+            width, height = height, width
+
+        # Let libjpeg decode at 1/2, 1/4 or 1/8 scale (no-op for other formats).
+        # Page shape follows image shape, so the raw size gives the right hint.
+        img.draft("RGB", _scale_hint(*img.size))
+
+        # Fix phone-camera EXIF rotation
+        img = ImageOps.exif_transpose(img)
+
+        # Handle transparency by compositing onto white background
+        transparency = img.info.get("transparency")
+        if img.mode == "P" and isinstance(transparency, int):
+            # Single transparent palette entry: repaint it white, no RGBA pass needed
+            palette = img.getpalette()
+            idx = transparency * 3
+            palette.extend([0] * (idx + 3 - len(palette)))
+            palette[idx:idx + 3] = [255, 255, 255]
+            img.putpalette(palette)
+            img = img.convert("RGB")
+        elif img.mode in ("RGBA", "LA"):
+            img = _flatten_on_white(img)
+        elif img.mode == "P" and transparency is not None:
+            img = _flatten_on_white(img.convert("RGBA"))
+        else:
+            img = img.convert("RGB")
+
+        # Pixels only need RENDER_DPI at the placed size
+        _, _, _, _, new_w, new_h = _page_layout(width, height)
+
+        # Very large sources: cheap box reduce to ~2x the page size first
+        scale_hint = _scale_hint(width, height)
+        factor = max(img.size) // (2 * max(scale_hint))
+        if factor >= 2:
+            img = img.reduce(factor)
+
+        # Resample to the exact pixel box drawn on the page; after the box
+        # reduce the ratio is small, so bicubic is enough. Never upscale.
+        target_px = (math.ceil(new_w * RENDER_DPI / 72), math.ceil(new_h * RENDER_DPI / 72))
+        if img.width > target_px[0] or img.height > target_px[1]:
+            img = img.resize(target_px, Image.Resampling.BICUBIC)
+
+        # Hand back encoded bytes; much cheaper to pickle than raw pixels
+        buf = BytesIO()
+        img.save(buf, "JPEG", quality=quality, optimize=True, progressive=True, subsampling=2)
+
+    return buf.getvalue(), width, height
+
 
 # *********************************************************************
 # Main Converter Class                                                *
@@ -41,9 +327,23 @@ class ImageToPDFConverter:
         # List storing FULL image paths
         self.image_paths: list[str] = []
 
+        # Same paths as a set, for O(1) duplicate checks
+        self._path_set: set[str] = set()
+
+        # Filename shown for each path, computed once when the path is added
+        self._basename_cache: dict[str, str] = {}
+
+        # Prepared page images from earlier conversions:
+        # (path, size, mtime, dpi, quality) -> (JPEG path or prepared JPEG bytes, w, h).
+        # Only encoded data is kept; readers are built per conversion.
+        self._page_cache: OrderedDict[tuple[str, int, float, int, int],
+                                      tuple[str | bytes, int, int]] = OrderedDict()
+
         # UI variables
         self.output_pdf_name = tk.StringVar()
-        self.status_text = tk.StringVar(value="Ready")
+        self.status_text = tk.StringVar(value=_pillow_simd_hint() or "Ready")
+        self.group_by_orientation = tk.BooleanVar(value=False)
+        self.jpeg_quality = tk.IntVar(value=JPEG_QUALITY)
 
         # Listbox (shows filenames only)
         self.selected_images_listbox = tk.Listbox(
@@ -140,6 +440,30 @@ class ImageToPDFConverter:
         )
         pdf_name_entry.pack(pady=(0, 10))
 
+        group_check = tk.Checkbutton(
+            self.root,
+            text="Group portrait/landscape",
+            variable=self.group_by_orientation
+        )
+        group_check.pack()
+
+        quality_frame = tk.Frame(self.root)
+        quality_frame.pack(pady=(5, 0))
+
+        quality_label = tk.Label(quality_frame, text="JPEG quality (re-encoded images):")
+        quality_label.grid(row=0, column=0, padx=5)
+
+        quality_spinbox = tk.Spinbox(
+            quality_frame,
+            from_=JPEG_QUALITY_MIN,
+            to=JPEG_QUALITY_MAX,
+            increment=5,
+            textvariable=self.jpeg_quality,
+            width=5,
+            justify="center"
+        )
+        quality_spinbox.grid(row=0, column=1, padx=5)
+
         # *************************************************************
         # Convert Button                                              *
         # *************************************************************
@@ -167,7 +491,10 @@ class ImageToPDFConverter:
         if not paths:
             return
 
-        self.image_paths = list(paths)
+        # Drop duplicates within the selection while preserving order
+        self.image_paths = list(dict.fromkeys(paths))
+        self._path_set = set(self.image_paths)
+        self._basename_cache = {p: os.path.basename(p) for p in self.image_paths}
         self.update_selected_images_listbox()
         self.status_text.set(f"Selected {len(self.image_paths)} image(s).")
 
@@ -183,8 +510,10 @@ class ImageToPDFConverter:
 
         # Avoid duplicates while preserving order
         for p in paths:
-            if p not in self.image_paths:
+            if p not in self._path_set:
+                self._path_set.add(p)
                 self.image_paths.append(p)
+                self._basename_cache[p] = os.path.basename(p)
 
         self.update_selected_images_listbox()
         self.status_text.set(f"Selected {len(self.image_paths)} image(s).")
@@ -195,15 +524,17 @@ class ImageToPDFConverter:
     def update_selected_images_listbox(self) -> None:
         """Refresh listbox to display current filenames."""
 
+        # One Tcl call for the whole list instead of one per item
         self.selected_images_listbox.delete(0, tk.END)
-        for full_path in self.image_paths:
-            filename = os.path.basename(full_path)
-            self.selected_images_listbox.insert(tk.END, filename)
+        names = [self._basename_cache[p] for p in self.image_paths]
+        self.selected_images_listbox.insert(tk.END, *names)
 
     def clear_list(self) -> None:
         """Clear all selected images."""
 
         self.image_paths.clear()
+        self._path_set.clear()
+        self._basename_cache.clear()
         self.update_selected_images_listbox()
         self.status_text.set("Cleared list.")
 
@@ -217,7 +548,9 @@ class ImageToPDFConverter:
 
         # Remove from bottom to top so indexes remain valid
         for idx in reversed(selected):
-            del self.image_paths[idx]
+            removed = self.image_paths.pop(idx)
+            self._path_set.discard(removed)
+            del self._basename_cache[removed]
 
         self.update_selected_images_listbox()
         self.status_text.set(f"Remaining {len(self.image_paths)} image(s).")
@@ -231,11 +564,12 @@ class ImageToPDFConverter:
         if selected[0] == 0:
             return  # already at top
 
-        # Move blocks upward preserving order
+        # Move blocks upward preserving order, rewriting only the swapped rows
+        listbox = self.selected_images_listbox
         for idx in selected:
             self.image_paths[idx - 1], self.image_paths[idx] = self.image_paths[idx], self.image_paths[idx - 1]
-
-        self.update_selected_images_listbox()
+            listbox.delete(idx - 1, idx)
+            listbox.insert(idx - 1, *(self._basename_cache[p] for p in self.image_paths[idx - 1:idx + 1]))
 
         # Re-select moved items
         for idx in [i - 1 for i in selected]:
@@ -250,11 +584,13 @@ class ImageToPDFConverter:
         if selected[-1] == len(self.image_paths) - 1:
             return  # already at bottom
 
-        # Move blocks downward (iterate reversed to avoid collisions)
+        # Move blocks downward (iterate reversed to avoid collisions),
+        # rewriting only the swapped rows
+        listbox = self.selected_images_listbox
         for idx in reversed(selected):
             self.image_paths[idx + 1], self.image_paths[idx] = self.image_paths[idx], self.image_paths[idx + 1]
-
-        self.update_selected_images_listbox()
+            listbox.delete(idx, idx + 1)
+            listbox.insert(idx, *(self._basename_cache[p] for p in self.image_paths[idx:idx + 2]))
 
         # Re-select moved items
         for idx in [i + 1 for i in selected]:
@@ -271,6 +607,43 @@ class ImageToPDFConverter:
                                    "Please select at least one image.")
             return
 
+        # Check every file up front so a bad path fails before any encoding work;
+        # the (size, mtime) stats also key the page cache
+        file_stats: dict[str, tuple[int, float]] = {}
+        bad: list[str] = []
+        for p in self.image_paths:
+            try:
+                st = os.stat(p)
+            except OSError:
+                bad.append(p)
+                continue
+            # Empty or unreadable files can't be converted
+            if (not stat.S_ISREG(st.st_mode) or st.st_size == 0
+                    or not os.access(p, os.R_OK)
+                    or os.path.splitext(p)[1].lower() not in SUPPORTED_EXTENSIONS):
+                bad.append(p)
+                continue
+            file_stats[p] = (st.st_size, st.st_mtime)
+
+        if bad:
+            names = "\n".join(self._basename_cache[p] for p in bad[:10])
+            if len(bad) > 10:
+                names += f"\n... and {len(bad) - 10} more"
+            self.status_text.set("Error.")
+            messagebox.showerror("Cannot convert",
+                                 f"These files are missing or not supported images:\n{names}")
+            return
+
+        # Validate the re-encode quality before asking where to save
+        try:
+            quality = self.jpeg_quality.get()
+        except tk.TclError:
+            quality = None
+        if quality is None or not JPEG_QUALITY_MIN <= quality <= JPEG_QUALITY_MAX:
+            messagebox.showwarning("Invalid JPEG quality",
+                                   f"Enter a whole number from {JPEG_QUALITY_MIN} to {JPEG_QUALITY_MAX}.")
+            return
+
         # Ask user where to save the PDF
         default_name = self.output_pdf_name.get().strip() or "output"
 
@@ -284,50 +657,95 @@ class ImageToPDFConverter:
             return
 
         try:
-            # Create PDF canvas (pagesize will change per page if we do landscape/portrait)
-            pdf = canvas.Canvas(save_path)
+            # Pillow also decodes in this process (page readers, orientation
+            # probes), so apply the truncated-image settings here too
+            _import_pil()
 
-            total = len(self.image_paths)
-            for i, image_path in enumerate(self.image_paths, start=1):
-                self.status_text.set(f"Processing {i}/{total}: {os.path.basename(image_path)}")
-                self.root.update_idletasks()
-
-                # Open image safely
-                with Image.open(image_path) as img:
-                    # Fix phone-camera EXIF rotation
-                    img = ImageOps.exif_transpose(img)
-
-                    # Handle transparency by compositing onto white background
-                    if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
-                        rgba = img.convert("RGBA")
-                        bg = Image.new("RGBA", rgba.size, (255, 255, 255, 255))
-                        img = Image.alpha_composite(bg, rgba).convert("RGB")
-                    else:
-                        img = img.convert("RGB")
+            from reportlab import rl_config
+            from reportlab.lib.utils import ImageReader
+            from reportlab.pdfgen import canvas
 
-                    # Auto page orientation based on image shape
-                    portrait_size = (612, 792)   # Letter portrait
-                    landscape_size = (792, 612)  # Letter landscape
-                    page_w, page_h = portrait_size if img.height >= img.width else landscape_size
+            # Embed JPEG streams as binary; the default ASCII85 pass re-encodes
+            # every passthrough file in pure Python on the Tk thread
+            rl_config.useA85 = 0
 
-                    pdf.setPageSize((page_w, page_h))
-
-                    # Margins & available area
-                    margin = 36  # 0.5 inch
-                    available_w = page_w - 2 * margin
-                    available_h = page_h - 2 * margin
-
-                    # Scale to fit while preserving aspect ratio
-                    scale = min(available_w / img.width, available_h / img.height)
-                    new_w = img.width * scale
-                    new_h = img.height * scale
+            # Create PDF canvas (pagesize will change per page if we do landscape/portrait).
+            # The canvas keeps every embedded image until save(), so peak memory
+            # still grows with the size of the batch.
+            pdf = canvas.Canvas(save_path)
 
-                    # Center on page
-                    x = (page_w - new_w) / 2
-                    y = (page_h - new_h) / 2
+            # Optionally put all portrait pages first, then all landscape ones
+            image_paths = self.image_paths
+            if self.group_by_orientation.get():
+                portrait = [_is_portrait(p) for p in image_paths]
+                image_paths = ([p for p, tall in zip(image_paths, portrait) if tall]
+                               + [p for p, tall in zip(image_paths, portrait) if not tall])
+
+            total = len(image_paths)
+
+            # Refresh the status line at most ~50 times per batch
+            stride = math.ceil(total / 50)
+
+            # Reuse pages prepared by earlier conversions and embed upright JPEGs straight
+            # from disk; only the rest need decoding
+            # (pages holds only paths or cached bytes; readers are built in the draw loop)
+            keys = [(p, *file_stats[p], RENDER_DPI, quality) for p in image_paths]
+            pages: list[tuple[str | bytes, int, int] | None] = []
+            to_prepare: list[str] = []
+            for image_path, key in zip(image_paths, keys):
+                entry = self._page_cache.get(key)
+                if entry is None:
+                    meta = _fast_jpeg_metadata(image_path)
+                    if meta is not None and meta[2] == 1:
+                        # Drawn by file name: ReportLab embeds the file via its own
+                        # JPEG header reader, with no PIL decode on the Tk thread
+                        entry = image_path, meta[0], meta[1]
+                    else:
+                        to_prepare.append(image_path)
+                pages.append(entry)
+
+            page_size: tuple[int, int] | None = None
+            workers = max(1, min(len(to_prepare), os.cpu_count() or 1))
+
+            # Decode/scale in worker processes; draw pages in order on the Tk thread
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                # Keep a bounded window of pages in flight so worker results
+                # don't queue up ahead of the drawing loop
+                remaining = iter(to_prepare)
+                in_flight: deque[Future] = deque(
+                    pool.submit(_prepare_image, p, quality) for p in itertools.islice(remaining, 2 * workers)
+                )
+
+                for i, (image_path, key, entry) in enumerate(
+                        zip(image_paths, keys, pages), start=1):
+                    if i == 1 or i == total or i % stride == 0:
+                        self.status_text.set(f"Processing {i}/{total}: {self._basename_cache[image_path]}")
+                        self.root.update_idletasks()
+
+                    if entry is None:
+                        # Embed the JPEG stream as-is instead of re-encoding a PIL image
+                        jpeg_bytes, width, height = in_flight.popleft().result()
+                        next_path = next(remaining, None)
+                        if next_path is not None:
+                            in_flight.append(pool.submit(_prepare_image, next_path, quality))
+                        entry = jpeg_bytes, width, height
+
+                    self._remember_page(key, entry)
+                    source, width, height = entry
+
+                    # JPEG files are drawn by name; prepared bytes need a fresh reader
+                    image = source if isinstance(source, str) else ImageReader(BytesIO(source))
+
+                    page_w, page_h, x, y, new_w, new_h = _page_layout(width, height)
+
+                    # Page size carries over to later pages; only set it when it changes
+                    if (page_w, page_h) != page_size:
+                        page_size = (page_w, page_h)
+                        pdf.setPageSize(page_size)
 
                     # Page background is already white; no need for a white rect.
-                    pdf.drawInlineImage(img, x, y, width=new_w, height=new_h)
+                    pdf.drawImage(image, x, y, width=new_w, height=new_h,
+                                  preserveAspectRatio=False)
                     pdf.showPage()
 
             pdf.save()
@@ -338,6 +756,15 @@ class ImageToPDFConverter:
             self.status_text.set("Error.")
             messagebox.showerror("Conversion failed", f"An error occurred:\n{ex}")
 
+    def _remember_page(self, key: tuple[str, int, float, int, int],
+                       entry: tuple[str | bytes, int, int]) -> None:
+        """Store a prepared page image, evicting the least recently used ones."""
+
+        self._page_cache[key] = entry
+        self._page_cache.move_to_end(key)
+        while len(self._page_cache) > PAGE_CACHE_SIZE:
+            self._page_cache.popitem(last=False)
+
 # *********************************************************************
 # Application Entry Point                                             *
 # *********************************************************************